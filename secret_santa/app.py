@@ -1,9 +1,10 @@
 import logging
+import time
 
 from flask import Flask, request
 from twilio.base.exceptions import TwilioRestException
 
-from secret_santa import manager, settings
+from secret_santa import manager, recorder, settings
 
 logger = logging.getLogger(__name__)
 
@@ -11,6 +12,9 @@ logger = logging.getLogger(__name__)
 def create_app() -> Flask:
     app = Flask(__name__)
     app.config["game"] = manager.Game(settings.get_recipients(), settings.START_TRIGGER)
+    app.config["recorder"] = (
+        recorder.Recorder(settings.RECORD_FILE) if settings.RECORD_FILE else None
+    )
 
     @app.route("/sms", methods=["POST"])
     def sms_reply():
@@ -18,10 +22,18 @@ def create_app() -> Flask:
         Twilio SMS webhook endpoint for the Secret Santa game!
         """
 
-        msg_body = request.values.get("Body").strip()
+        arrived_at = time.time()
+        raw_body = request.values.get("Body")
         sender = request.values.get("From")
         game = app.config["game"]
 
+        if app.config["recorder"]:
+            app.config["recorder"].record(
+                raw_body, sender, request.values.get("MessageSid"), arrived_at
+            )
+
+        msg_body = raw_body.strip()
+
         try:
             game.handle_message(msg_body, sender)
 
@@ -0,0 +1,52 @@
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def match_many(recipient_count: int, count: int, seed=None) -> np.ndarray:
+    """
+    Generate many independent Secret Santa matchings at once.
+
+    Returns a (count, recipient_count) integer array where each row is a derangement,
+    ie. row[i] is the index of recipient i's secret santa, and row[i] != i.
+
+    Rows are generated as random permutations (argsort of random keys), and any row
+    where someone drew themselves is rejected and regenerated. Roughly 1/e of
+    permutations are derangements, so only a handful of rounds are needed.
+    """
+
+    if recipient_count < 2:
+        raise ValueError("Must have more two or more Secret Santa recipients!")
+
+    rng = np.random.default_rng(seed)
+    identity = np.arange(recipient_count)
+    matchings = np.empty((count, recipient_count), dtype=np.intp)
+    pending = np.arange(count)
+
+    while pending.size:
+        rows = np.argsort(rng.random((pending.size, recipient_count)), axis=1)
+        valid = ~(rows == identity).any(axis=1)
+        matchings[pending[valid]] = rows[valid]
+        pending = pending[~valid]
+        logger.debug(f"Rejected {pending.size} matchings with fixed points")
+
+    return matchings
+
+
+def to_matches(recipient_list: list, row) -> dict:
+    """
+    Map a row from match_many back to a {recipient: secret santa} dict, like matcher.match returns.
+    """
+
+    return {recipient: recipient_list[index] for recipient, index in zip(recipient_list, row)}
+
+
+def iter_matches(recipient_list: list, matchings: np.ndarray):
+    """
+    Lazily map every row from match_many back to a {recipient: secret santa} dict.
+    """
+
+    for row in matchings.tolist():
+        yield to_matches(recipient_list, row)
@@ -1,4 +1,3 @@
-import concurrent.futures
 import logging
 
 from secret_santa import matcher, settings, utils
@@ -96,19 +95,12 @@ class Game:
         Send all recipients the first message asking for their wishlist.
         """
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-            message = "Hello {}!\n\nPlease reply with your Secret Santa wishlist! 🎄🎁"
+        message = "Hello {name}!\n\nPlease reply with your Secret Santa wishlist! 🎄🎁"
 
-            # Schedule messages for all recipients
-            outgoing_msgs = [
-                executor.submit(
-                    utils.send_message, message_body=message.format(name), recipient_number=number
-                )
-                for number, name in self.recipients.items()
-            ]
-
-            for future in concurrent.futures.as_completed(outgoing_msgs):
-                _ = future.result()
+        results = utils.send_batch(
+            message, ((number, {"name": name}) for number, name in self.recipients.items())
+        )
+        utils.raise_for_errors(results)
 
     def send_already_started_warning(self, recipient: str) -> None:
         """
@@ -142,26 +134,25 @@ class Game:
         # ex. {'+1234567891': '+9876543219', ...}
         matches = matcher.match(list(self.recipients.keys()))
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-            message = (
-                "Your Secret Santa is...\n\n"
-                "✨🎅🏼 {name} 🎅🏼✨\n\n"
-                "Their wishlist is:\n{wishlist}\n\n"
-                f"🚨 Remember! 🚨\n\nThe budget is ${settings.DOLLAR_BUDGET:.2f}!"
-            )
-
-            # Schedule messages for all recipients
-            outgoing_msgs = [
-                executor.submit(
-                    utils.send_message,
-                    message_body=message.format(
-                        name=self.recipients.get(secret_santa_number).upper(),
-                        wishlist=self.WISHLIST.get(secret_santa_number),
-                    ),
-                    recipient_number=recipient_number,
+        # Per-game parts (the budget) are rendered once, the rest per recipient
+        message = (
+            "Your Secret Santa is...\n\n"
+            "✨🎅🏼 {name} 🎅🏼✨\n\n"
+            "Their wishlist is:\n{wishlist}\n\n"
+            f"🚨 Remember! 🚨\n\nThe budget is ${settings.DOLLAR_BUDGET:.2f}!"
+        )
+
+        results = utils.send_batch(
+            message,
+            (
+                (
+                    recipient_number,
+                    {
+                        "name": self.recipients.get(secret_santa_number).upper(),
+                        "wishlist": self.WISHLIST.get(secret_santa_number),
+                    },
                 )
                 for recipient_number, secret_santa_number in matches.items()
-            ]
-
-            for future in concurrent.futures.as_completed(outgoing_msgs):
-                _ = future.result()
+            ),
+        )
+        utils.raise_for_errors(results)
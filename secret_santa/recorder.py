@@ -0,0 +1,152 @@
+import argparse
+import json
+import logging
+import statistics
+import threading
+import time
+
+from secret_santa import manager, settings, utils
+
+logger = logging.getLogger(__name__)
+
+
+class Recorder:
+    """
+    Append-only log of inbound webhook requests.
+
+    Each request is written as one compact JSON line, ex.
+    {"ts":1639612800.123,"sid":"SM123","from":"+1234567891","body":"start123"}
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        # Line buffered, so each record is flushed without an explicit flush call
+        self._file = open(path, "a", buffering=1, encoding="utf-8")
+
+    def __repr__(self) -> str:
+        return f"Recorder({self.path})"
+
+    def record(self, body: str, sender: str, message_sid: str, timestamp: float) -> None:
+        """
+        Append a single inbound request to the log.
+        """
+
+        line = json.dumps(
+            {"ts": timestamp, "sid": message_sid, "from": sender, "body": body},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+        with self._lock:
+            self._file.write(line + "\n")
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+def load(path: str) -> list:
+    """
+    Read recorded requests from a log file, skipping blank or truncated lines.
+    """
+
+    records = []
+    with open(path, encoding="utf-8") as logfile:
+        for line in logfile:
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping malformed record: {line!r}")
+    return records
+
+
+def replay(records: list, game: manager.Game, realtime: bool = False) -> dict:
+    """
+    Feed recorded requests back into the game with outbound messages stubbed out.
+
+    If realtime is set, wait between requests to match the original arrival timing,
+    otherwise replay as fast as possible.
+    Returns a report of handling latency (in seconds) and throughput.
+    """
+
+    latencies = []
+    sent = []
+    # The stub is called from send_batch's worker threads
+    sent_lock = threading.Lock()
+
+    def fake_send_message(message_body: str, recipient_number: str) -> str:
+        with sent_lock:
+            sent.append(recipient_number)
+            return f"SMreplay{len(sent)}"
+
+    send_message = utils.send_message
+    utils.send_message = fake_send_message
+
+    try:
+        start = time.perf_counter()
+
+        for record in records:
+            if realtime and latencies:
+                # Time the record should arrive at, relative to the start of the replay
+                due = start + (record["ts"] - records[0]["ts"])
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+
+            handle_start = time.perf_counter()
+            game.handle_message((record["body"] or "").strip(), record["from"])
+            latencies.append(time.perf_counter() - handle_start)
+
+        elapsed = time.perf_counter() - start
+    finally:
+        utils.send_message = send_message
+
+    return report(latencies, elapsed, len(sent))
+
+
+def report(latencies: list, elapsed: float, sent: int) -> dict:
+    """
+    Summarize replay latencies.
+    """
+
+    if not latencies:
+        return {"requests": 0, "sent": sent, "elapsed": elapsed, "throughput": 0.0}
+
+    ordered = sorted(latencies)
+    return {
+        "requests": len(ordered),
+        "sent": sent,
+        "elapsed": elapsed,
+        "throughput": len(ordered) / elapsed if elapsed else float("inf"),
+        "latency_mean": statistics.mean(ordered),
+        "latency_p50": ordered[int(0.50 * (len(ordered) - 1))],
+        "latency_p95": ordered[int(0.95 * (len(ordered) - 1))],
+        "latency_max": ordered[-1],
+    }
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Replay recorded Secret Santa webhook traffic.")
+    parser.add_argument("path", type=str, help="Path to a recorded log file", action="store")
+    parser.add_argument(
+        "--realtime",
+        help="Replay at the original arrival timing instead of as fast as possible",
+        action="store_true",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    settings.setup()
+    game = manager.Game(settings.get_recipients(), settings.START_TRIGGER)
+    results = replay(load(args.path), game, realtime=args.realtime)
+
+    print(f"Replayed {results['requests']} requests ({results['sent']} messages stubbed)")
+    print(f"Elapsed: {results['elapsed']:.4f}s")
+    print(f"Throughput: {results['throughput']:.2f} requests/s")
+    if results["requests"]:
+        for key in ("latency_mean", "latency_p50", "latency_p95", "latency_max"):
+            print(f"{key}: {results[key] * 1000:.3f}ms")
@@ -16,6 +16,7 @@ TWILIO_ACCOUNT_SID = os.getenv("TWILIO_ACCOUNT_SID")
 TWILIO_AUTH_TOKEN = os.getenv("TWILIO_AUTH_TOKEN")
 TWILIO_SENDING_NUMBER = os.getenv("TWILIO_SENDING_NUMBER")
 DOLLAR_BUDGET = int(os.getenv("DOLLAR_BUDGET", "30"))
+RECORD_FILE = os.getenv("RECORD_FILE")
 START_TRIGGER = "start123"
 CSV_FILE = BASE_DIR / "numbers.csv"
 RECIPIENT_DICT = {}
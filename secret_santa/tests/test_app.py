@@ -3,7 +3,7 @@ from unittest.mock import create_autospec, patch
 
 from twilio.base.exceptions import TwilioRestException
 
-from secret_santa import manager
+from secret_santa import manager, recorder
 from secret_santa.app import create_app
 
 
@@ -16,6 +16,7 @@ class WebhookTests(unittest.TestCase):
         self.app.config["TESTING"] = True
         self.app.config["DEBUG"] = False
         self.app.config["game"] = create_autospec(manager.Game)
+        self.app.config["recorder"] = None
         self.client = self.app.test_client()
 
         self.addCleanup(patch.stopall)
@@ -32,6 +33,20 @@ class WebhookTests(unittest.TestCase):
         self.assertEqual(response.get_data(as_text=True), "<Response></Response>")
         self.app.config["game"].handle_message.assert_called_once_with("Howdy!", "+1234567891")
 
+    def test_successful_response_is_recorded(self):
+        self.app.config["recorder"] = create_autospec(recorder.Recorder)
+
+        response = self.client.post(
+            "/sms", data={"Body": " Howdy! ", "From": "+1234567891", "MessageSid": "SM123"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.app.config["recorder"].record.assert_called_once()
+        args, _ = self.app.config["recorder"].record.call_args
+        body, sender, message_sid, _ = args
+        self.assertEqual((body, sender, message_sid), (" Howdy! ", "+1234567891", "SM123"))
+        self.app.config["game"].handle_message.assert_called_once_with("Howdy!", "+1234567891")
+
     def test_handle_message_raises_twilio_exception(self):
         self.app.config["game"].handle_message.side_effect = TwilioRestException(
             400, "twilio/post/endpoint"
@@ -0,0 +1,48 @@
+import unittest
+
+import numpy as np
+
+from secret_santa import bulk_matcher
+
+
+class BulkMatcherTests(unittest.TestCase):
+    RECIPIENTS = {
+        "+1111111111": "Alice",
+        "+2222222222": "Bob",
+    }
+
+    def test_match_many(self):
+        matchings = bulk_matcher.match_many(5, 1000, seed=42)
+
+        self.assertEqual(matchings.shape, (1000, 5))
+        self.assertFalse((matchings == np.arange(5)).any())
+        for row in matchings:
+            self.assertEqual(sorted(row), list(range(5)))
+
+    def test_match_many_is_seedable(self):
+        np.testing.assert_array_equal(
+            bulk_matcher.match_many(4, 10, seed=7), bulk_matcher.match_many(4, 10, seed=7)
+        )
+
+    def test_match_many_too_few_recipients(self):
+        with self.assertRaises(ValueError):
+            bulk_matcher.match_many(1, 10)
+
+    def test_to_matches(self):
+        recipient_list = list(self.RECIPIENTS.keys())
+
+        match_dict = bulk_matcher.to_matches(recipient_list, np.array([1, 0]))
+
+        self.assertEqual(match_dict, {"+1111111111": "+2222222222", "+2222222222": "+1111111111"})
+
+    def test_iter_matches(self):
+        recipient_list = ["a", "b", "c"]
+        matchings = bulk_matcher.match_many(len(recipient_list), 50, seed=1)
+
+        match_dicts = list(bulk_matcher.iter_matches(recipient_list, matchings))
+
+        self.assertEqual(len(match_dicts), 50)
+        for match_dict in match_dicts:
+            self.assertEqual(sorted(match_dict.values()), recipient_list)
+            for key, val in match_dict.items():
+                self.assertNotEqual(key, val)
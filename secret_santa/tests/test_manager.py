@@ -1,6 +1,8 @@
 import unittest
 from unittest.mock import call, patch
 
+from twilio.base.exceptions import TwilioRestException
+
 from secret_santa import manager, settings
 
 ALICE_NUMBER = "+1234567891"
@@ -139,6 +141,17 @@ class ManagerTest(unittest.TestCase):
         self.assertEqual(self.mock_send_message.call_count, 2)
         self.assertEqual(self.mock_send_message.call_args_list, expected)
 
+    def test_send_wishlist_prompt_raises_twilio_exception(self):
+        self.mock_send_message.side_effect = [
+            TwilioRestException(400, "twilio/post/endpoint"),
+            "SM2",
+        ]
+
+        with self.assertRaises(TwilioRestException):
+            self.game.send_wishlist_prompt()
+
+        self.assertEqual(self.mock_send_message.call_count, 2)
+
     def test_send_already_started_warning(self):
         expected = [
             call(
@@ -0,0 +1,122 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import call, create_autospec, patch
+
+from secret_santa import manager, recorder, settings, utils
+
+ALICE_NUMBER = "+1234567891"
+BOB_NUMBER = "+9876543219"
+RECIPIENTS = {ALICE_NUMBER: "Alice", BOB_NUMBER: "Bob"}
+
+
+class RecorderTests(unittest.TestCase):
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = os.path.join(tmpdir.name, "sms.log")
+
+        self.recorder = recorder.Recorder(self.path)
+        self.addCleanup(self.recorder.close)
+
+    def test_recorder_repr(self):
+        self.assertEqual(repr(self.recorder), f"Recorder({self.path})")
+
+    def test_record_appends_compact_json_lines(self):
+        self.recorder.record("start123", ALICE_NUMBER, "SM1", 100.0)
+        self.recorder.record("socks 🧦\ncoffee", BOB_NUMBER, "SM2", 101.5)
+
+        with open(self.path, encoding="utf-8") as logfile:
+            lines = logfile.read().splitlines()
+
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(
+            lines[0], '{"ts":100.0,"sid":"SM1","from":"+1234567891","body":"start123"}'
+        )
+        self.assertEqual(json.loads(lines[1])["body"], "socks 🧦\ncoffee")
+
+    @patch("secret_santa.recorder.logger")
+    def test_load_skips_blank_and_malformed_lines(self, mock_logger):
+        self.recorder.record("start123", ALICE_NUMBER, "SM1", 100.0)
+        with open(self.path, "a", encoding="utf-8") as logfile:
+            logfile.write('\n{"ts":101.0,"sid"')
+
+        records = recorder.load(self.path)
+
+        self.assertEqual(
+            records, [{"ts": 100.0, "sid": "SM1", "from": ALICE_NUMBER, "body": "start123"}]
+        )
+        mock_logger.warning.assert_called_once_with(
+            'Skipping malformed record: \'{"ts":101.0,"sid"\''
+        )
+
+
+class ReplayTests(unittest.TestCase):
+    RECORDS = [
+        {"ts": 100.0, "sid": "SM1", "from": ALICE_NUMBER, "body": " start123 "},
+        {"ts": 100.5, "sid": "SM2", "from": ALICE_NUMBER, "body": "cookies"},
+        {"ts": 101.0, "sid": "SM3", "from": BOB_NUMBER, "body": "coffee"},
+    ]
+
+    def test_replay_calls_handle_message(self):
+        game = create_autospec(manager.Game)
+
+        results = recorder.replay(self.RECORDS, game)
+
+        self.assertEqual(
+            game.handle_message.call_args_list,
+            [
+                call(settings.START_TRIGGER, ALICE_NUMBER),
+                call("cookies", ALICE_NUMBER),
+                call("coffee", BOB_NUMBER),
+            ],
+        )
+        self.assertEqual(results["requests"], 3)
+        self.assertEqual(results["sent"], 0)
+
+    @patch("secret_santa.utils.client")
+    def test_replay_full_game_stubs_outbound_messages(self, mock_client):
+        game = manager.Game(RECIPIENTS, settings.START_TRIGGER)
+        original_send_message = utils.send_message
+
+        results = recorder.replay(self.RECORDS, game)
+
+        # 2 wishlist prompts, 2 pending messages and 2 announcements
+        self.assertEqual(results["sent"], 6)
+        self.assertEqual(results["requests"], 3)
+        self.assertGreater(results["throughput"], 0)
+        self.assertLessEqual(results["latency_p50"], results["latency_max"])
+        self.assertIs(utils.send_message, original_send_message)
+        mock_client.messages.create.assert_not_called()
+
+    @patch("secret_santa.recorder.time.sleep")
+    def test_replay_realtime_waits_between_requests(self, mock_sleep):
+        game = create_autospec(manager.Game)
+
+        recorder.replay(self.RECORDS, game, realtime=True)
+
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    def test_replay_no_records(self):
+        results = recorder.replay([], create_autospec(manager.Game))
+
+        self.assertEqual(results["requests"], 0)
+        self.assertEqual(results["throughput"], 0.0)
+
+    @patch("sys.argv", ["recorder.py", "sms.log", "--realtime"])
+    def test_parse_args(self):
+        args = recorder.parse_args()
+
+        self.assertEqual(args.path, "sms.log")
+        self.assertTrue(args.realtime)
+
+    def test_replay_restores_send_message_on_error(self):
+        game = create_autospec(manager.Game)
+        game.handle_message.side_effect = RuntimeError
+        original_send_message = utils.send_message
+
+        with self.assertRaises(RuntimeError):
+            recorder.replay(self.RECORDS, game)
+
+        self.assertIs(utils.send_message, original_send_message)
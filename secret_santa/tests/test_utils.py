@@ -1,5 +1,7 @@
+import threading
+import time
 import unittest
-from unittest.mock import patch
+from unittest.mock import call, patch
 
 from twilio.base.exceptions import TwilioRestException
 
@@ -7,6 +9,7 @@ from secret_santa import utils
 
 TWILIO_SENDING_NUMBER = "+1111111111"
 ALICE_NUMBER = "+1234567891"
+BOB_NUMBER = "+9876543219"
 
 
 @patch("secret_santa.settings.TWILIO_ACCOUNT_SID", "test-twilio-account-sid")
@@ -20,8 +23,11 @@ class UtilsTest(unittest.TestCase):
         self.addCleanup(patch.stopall)
 
     def test_send_message(self):
-        utils.send_message(message_body="Howdy!", recipient_number=ALICE_NUMBER)
+        self.mock_client_create.return_value.sid = "SM123"
 
+        sid = utils.send_message(message_body="Howdy!", recipient_number=ALICE_NUMBER)
+
+        self.assertEqual(sid, "SM123")
         self.mock_client_create.assert_called_once_with(
             body="Howdy!", to=ALICE_NUMBER, from_=TWILIO_SENDING_NUMBER
         )
@@ -37,3 +43,118 @@ class UtilsTest(unittest.TestCase):
             body="Howdy!", to=ALICE_NUMBER, from_=TWILIO_SENDING_NUMBER
         )
         mock_logger.exception.assert_called_with("🚨🚨🚨 Unable to send Twilio message! 🚨🚨🚨")
+
+    @patch("secret_santa.utils.send_message", autospec=True)
+    def test_send_batch(self, mock_send_message):
+        mock_send_message.side_effect = (
+            lambda message_body, recipient_number: f"SM{recipient_number}"
+        )
+
+        results = utils.send_batch(
+            "Howdy {name}!", ((ALICE_NUMBER, {"name": "Alice"}), (BOB_NUMBER, {"name": "Bob"}))
+        )
+
+        self.assertCountEqual(
+            mock_send_message.call_args_list,
+            [
+                call(message_body="Howdy Alice!", recipient_number=ALICE_NUMBER),
+                call(message_body="Howdy Bob!", recipient_number=BOB_NUMBER),
+            ],
+        )
+        self.assertEqual(
+            [result.recipient_number for result in results], [ALICE_NUMBER, BOB_NUMBER]
+        )
+        self.assertEqual(
+            [result.sid for result in results], [f"SM{ALICE_NUMBER}", f"SM{BOB_NUMBER}"]
+        )
+        self.assertEqual([result.error for result in results], [None, None])
+        for result in results:
+            self.assertGreaterEqual(result.latency, 0)
+
+    @patch("secret_santa.utils.send_message", autospec=True)
+    def test_send_batch_consumes_params_lazily(self, mock_send_message):
+        recipient_count = utils.SEND_WORKERS * 4
+        consumed = 0
+        started = threading.Semaphore(0)
+        unblock = threading.Event()
+
+        def params():
+            nonlocal consumed
+            for i in range(recipient_count):
+                consumed += 1
+                yield str(i), {"name": i}
+
+        def blocked_send(message_body, recipient_number):
+            started.release()
+            unblock.wait(timeout=5)
+            return f"SM{recipient_number}"
+
+        mock_send_message.side_effect = blocked_send
+        batch = threading.Thread(target=utils.send_batch, args=("Howdy {name}!", params()))
+        batch.start()
+
+        # Wait until every worker is busy, then give the batch loop time to run ahead
+        for _ in range(utils.SEND_WORKERS):
+            self.assertTrue(started.acquire(timeout=5))
+        time.sleep(0.05)
+
+        try:
+            self.assertLessEqual(consumed, utils.SEND_WORKERS + 1)
+        finally:
+            unblock.set()
+            batch.join(timeout=5)
+
+        self.assertEqual(consumed, recipient_count)
+        self.assertEqual(mock_send_message.call_count, recipient_count)
+
+    @patch("secret_santa.utils.send_message", autospec=True)
+    def test_send_batch_records_non_twilio_errors(self, mock_send_message):
+        error = ConnectionError("connection reset")
+        mock_send_message.side_effect = [error, "SM2"]
+
+        with patch("secret_santa.utils.logger"):
+            results = utils.send_batch(
+                "Howdy {name}!", ((ALICE_NUMBER, {"name": "Alice"}), (BOB_NUMBER, {"name": "Bob"}))
+            )
+
+        self.assertEqual(len(results), 2)
+        self.assertEqual(sum(result.error is error for result in results), 1)
+        self.assertEqual(sum(result.sid == "SM2" for result in results), 1)
+
+    @patch("secret_santa.utils.logger")
+    @patch("secret_santa.utils.send_message", autospec=True)
+    def test_send_batch_records_render_errors(self, mock_send_message, mock_logger):
+        results = utils.send_batch("Howdy {name}!", ((ALICE_NUMBER, {}),))
+
+        self.assertIsInstance(results[0].error, KeyError)
+        self.assertIsNone(results[0].sid)
+        mock_send_message.assert_not_called()
+        mock_logger.exception.assert_called_once_with(
+            f"🚨🚨🚨 Unable to send message to {ALICE_NUMBER}! 🚨🚨🚨"
+        )
+
+    @patch("secret_santa.utils.send_message", autospec=True)
+    def test_send_batch_records_errors_and_continues(self, mock_send_message):
+        error = TwilioRestException(400, "twilio/post/endpoint")
+        mock_send_message.side_effect = [error, "SM2"]
+
+        results = utils.send_batch(
+            "Howdy {name}!", ((ALICE_NUMBER, {"name": "Alice"}), (BOB_NUMBER, {"name": "Bob"}))
+        )
+
+        self.assertEqual(mock_send_message.call_count, 2)
+        self.assertEqual(sum(result.error is error for result in results), 1)
+        self.assertEqual(sum(result.sid == "SM2" for result in results), 1)
+
+    def test_raise_for_errors(self):
+        error = TwilioRestException(400, "twilio/post/endpoint")
+        results = [
+            utils.SendResult(ALICE_NUMBER, "SM1", None, 0.1),
+            utils.SendResult(BOB_NUMBER, None, error, 0.1),
+        ]
+
+        with self.assertRaises(TwilioRestException):
+            utils.raise_for_errors(results)
+
+    def test_raise_for_errors_no_errors(self):
+        utils.raise_for_errors([utils.SendResult(ALICE_NUMBER, "SM1", None, 0.1)])
@@ -1,23 +1,94 @@
+import concurrent.futures
 import logging
+import time
+from collections import namedtuple
 
 from twilio.base.exceptions import TwilioRestException
 from twilio.rest import Client
 
 from secret_santa import settings
 
+# Number of messages sent concurrently in a batch
+SEND_WORKERS = 3
+
+# The client reuses one pooled HTTP session for every send
 client = Client(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
 logger = logging.getLogger(__name__)
 
+SendResult = namedtuple("SendResult", ["recipient_number", "sid", "error", "latency"])
+
 
-def send_message(message_body: str, recipient_number: str) -> None:
+def send_message(message_body: str, recipient_number: str) -> str:
     """
     Thin wrapper around Twilio client to send an SMS message.
+    Returns the message SID.
     """
 
     try:
-        client.messages.create(
+        message = client.messages.create(
             body=message_body, to=recipient_number, from_=settings.TWILIO_SENDING_NUMBER
         )
     except TwilioRestException:
         logger.exception("🚨🚨🚨 Unable to send Twilio message! 🚨🚨🚨")
         raise
+
+    return message.sid
+
+
+def _send_rendered(template: str, recipient_number: str, params: dict) -> SendResult:
+    start = time.perf_counter()
+    sid, error = None, None
+
+    try:
+        sid = send_message(
+            message_body=template.format(**params), recipient_number=recipient_number
+        )
+    except TwilioRestException as e:
+        # Already logged by send_message
+        error = e
+    except Exception as e:
+        logger.exception(f"🚨🚨🚨 Unable to send message to {recipient_number}! 🚨🚨🚨")
+        error = e
+
+    return SendResult(recipient_number, sid, error, time.perf_counter() - start)
+
+
+def send_batch(template: str, recipient_params) -> list:
+    """
+    Send a templated SMS message to many recipients.
+
+    recipient_params is an iterable of (recipient_number, params) pairs, and each message
+    is rendered with template.format(**params) only when it's about to be sent.
+    At most SEND_WORKERS messages are in flight at once, so the iterable is consumed lazily.
+
+    Returns a list of SendResult (recipient_number, sid, error, latency) in the same
+    order as recipient_params. A failed send (or render) doesn't stop the rest of the batch,
+    its exception is stored in the result's error.
+    """
+
+    futures = []
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=SEND_WORKERS) as executor:
+        in_flight = set()
+
+        for recipient_number, params in recipient_params:
+            if len(in_flight) >= SEND_WORKERS:
+                _, in_flight = concurrent.futures.wait(
+                    in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+
+            future = executor.submit(_send_rendered, template, recipient_number, params)
+            in_flight.add(future)
+            futures.append(future)
+
+    return [future.result() for future in futures]
+
+
+def raise_for_errors(results: list) -> None:
+    """
+    Re-raise the first error from a batch of send results, if any.
+    """
+
+    for result in results:
+        if result.error:
+            raise result.error